@@ -0,0 +1,51 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+
+# Native DIGIPIN encoder used by digipin_core when built:
+#     cythonize -i _digipin_c.pyx
+#
+# Implements the same 20-bit integer quantization as get_digipin. Callers
+# are expected to range-check coordinates first; the constants below must
+# match DIGIPIN_GRID and BOUNDS in digipin_core.py.
+
+cdef const char* GRID = b'FC98J327K456LMPT'
+
+cdef double MIN_LAT = 2.5
+cdef double MIN_LON = 63.5
+cdef double LAT_SCALE = (1 << 20) / (38.5 - 2.5)
+cdef double LON_SCALE = (1 << 20) / (99.5 - 63.5)
+
+cdef void _encode(double lat, double lon, unsigned char* buf) noexcept nogil:
+    cdef long li = <long>((lat - MIN_LAT) * LAT_SCALE)
+    cdef long lo = <long>((lon - MIN_LON) * LON_SCALE)
+    cdef int level, shift, row, col
+    cdef int pos = 0
+
+    # Only the maximum bound maps to 1 << 20; fold it into the last cell
+    li -= li >> 20
+    lo -= lo >> 20
+
+    for level in range(10):
+        shift = 18 - 2 * level
+        row = 3 - ((li >> shift) & 3)
+        col = (lo >> shift) & 3
+        buf[pos] = GRID[(row << 2) | col]
+        pos += 1
+        # Hyphen separators after the 3rd and 6th characters
+        if level == 2 or level == 5:
+            buf[pos] = b'-'
+            pos += 1
+
+def encode(double lat, double lon):
+    """Encodes one in-range coordinate pair into a hyphenated DIGIPIN (bytes)."""
+    cdef unsigned char buf[12]
+    _encode(lat, lon, buf)
+    return (<char*>buf)[:12]
+
+def encode_batch(const double[::1] lats, const double[::1] lons, unsigned char[:, ::1] out):
+    """Encodes in-range coordinates into the rows of an (N, 12) uint8 buffer."""
+    cdef Py_ssize_t i, n = lats.shape[0]
+    if lons.shape[0] != n or out.shape[0] != n or out.shape[1] != 12:
+        raise ValueError('Expected lats and lons of length N and an (N, 12) output buffer.')
+    with nogil:
+        for i in range(n):
+            _encode(lats[i], lons[i], &out[i, 0])
@@ -0,0 +1,513 @@
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    import _digipin_c  # Optional native encoder, built from _digipin_c.pyx
+except ImportError:
+    _digipin_c = None
+
+# DIGIPIN Encoder and Decoder Library
+# Developed by India Post, Department of Posts
+# Released under an open-source license for public use
+
+# This module contains the core functions for encoding/decoding DIGIPINs.
+# The command-line tools live in digipin_cli.py and digipin_menu.py.
+
+DIGIPIN_GRID = [
+    ['F', 'C', '9', '8'],
+    ['J', '3', '2', '7'],
+    ['K', '4', '5', '6'],
+    ['L', 'M', 'P', 'T']
+]
+
+BOUNDS = {
+    'minLat': 2.5,
+    'maxLat': 38.5,
+    'minLon': 63.5,
+    'maxLon': 99.5
+}
+
+# BOUNDS as plain module constants for the hot paths
+_MIN_LAT = BOUNDS['minLat']
+_MAX_LAT = BOUNDS['maxLat']
+_MIN_LON = BOUNDS['minLon']
+_MAX_LON = BOUNDS['maxLon']
+
+# Flattened grid as ASCII bytes, indexed by (row << 2) | col
+GRID = ''.join(char for row in DIGIPIN_GRID for char in row).encode('ascii')
+
+# Reverse lookup from grid character to its (row, col), built once at import
+_GRID_LOOKUP = {DIGIPIN_GRID[r][c]: (r, c) for r in range(4) for c in range(4)}
+
+# 256-entry lookup table mapping an ASCII code to its cell index (0..15),
+# with 0xFF marking characters that are not part of the grid
+_INVALID = 0xFF
+_CELL_INDEX = {ord(char): (r << 2) | c for char, (r, c) in _GRID_LOOKUP.items()}
+LUT = bytes(_CELL_INDEX.get(code, _INVALID) for code in range(256))
+
+# Output layout: character positions of the 10 levels in 'XXX-XXX-XXXX'
+_TEMPLATE = b'XXX-XXX-XXXX'
+SLOTS = (0, 1, 2, 4, 5, 6, 8, 9, 10, 11)
+
+# Number of cells along each axis after 10 levels of 4-way subdivision
+_CELLS = 1 << 20
+
+LAT_SCALE = _CELLS / (_MAX_LAT - _MIN_LAT)
+LON_SCALE = _CELLS / (_MAX_LON - _MIN_LON)
+
+# Decoded centre of a DIGIPIN cell, in degrees
+LatLng = namedtuple('LatLng', ['latitude', 'longitude'])
+
+# Number of recent results kept by the encoder/decoder caches
+CACHE_SIZE = 4096
+
+# Cell size in degrees at each level (both axes span 36 degrees and every
+# level divides the span by 4)
+_DIVS = tuple((_MAX_LAT - _MIN_LAT) / 4 ** level for level in range(1, 11))
+
+def _build_pack_pin():
+    """
+    Generates _pack_pin(li, lo), which turns the two 20-bit cell indices
+    into the hyphenated DIGIPIN as a single expression.
+
+    The 10-level loop is written out at import time so each call runs
+    without loop or hyphen bookkeeping. Level k reads the 2-bit row and
+    column at shift 18 - 2k and writes GRID[(row << 2) | col] to SLOTS[k];
+    row 0 is the highest latitude block, as in the JS logic, so the
+    latitude bits are flipped with ``^ 12`` (3 - r == r ^ 3).
+    """
+    parts = [str(byte) for byte in _TEMPLATE]
+    for level, slot in enumerate(SLOTS):
+        shift = 18 - 2 * level
+        parts[slot] = f'GRID[((li >> {shift} & 3) << 2 | lo >> {shift} & 3) ^ 12]'
+    source = (
+        'def _pack_pin(li, lo):\n'
+        f"    return bytes(({', '.join(parts)})).decode('ascii')\n"
+    )
+    namespace = {'GRID': GRID}
+    exec(source, namespace)
+    return namespace['_pack_pin']
+
+_pack_pin = _build_pack_pin()
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _encode_cached(lat: float, lon: float) -> str:
+    """Encodes in-range float coordinates; keyed on the exact values."""
+    # The grid is exactly 4x4 at each of the 10 levels, so the DIGIPIN is a
+    # 20-bit quantization of each axis: every level consumes 2 bits.
+    # The range check keeps both indices >= 0; only the maximum bound maps
+    # to 1 << 20, which ``i -= i >> 20`` folds into the last cell.
+    li = int((lat - _MIN_LAT) * LAT_SCALE)
+    lo = int((lon - _MIN_LON) * LON_SCALE)
+    li -= li >> 20
+    lo -= lo >> 20
+
+    return _pack_pin(li, lo)
+
+def get_digipin(lat: float, lon: float) -> str:
+    """
+    Encodes latitude and longitude into a 10-digit alphanumeric DIGIPIN.
+
+    Args:
+        lat (float): Latitude coordinate.
+        lon (float): Longitude coordinate.
+
+    Returns:
+        str: The 10-digit DIGIPIN code.
+
+    Raises:
+        ValueError: If latitude or longitude is out of the defined bounds.
+
+    >>> get_digipin(28.622788, 77.213033)  # Dak Bhawan, New Delhi
+    '39J-49L-L8T4'
+    >>> [get_digipin(lat, lon) for lat, lon in [(2.5, 63.5), (2.5, 99.5), (38.5, 63.5), (38.5, 99.5)]]
+    ['LLL-LLL-LLLL', 'TTT-TTT-TTTT', 'FFF-FFF-FFFF', '888-888-8888']
+    >>> get_digipin(1.0, 77.2)
+    Traceback (most recent call last):
+        ...
+    ValueError: Latitude 1.0 out of range (2.5 to 38.5)
+    """
+    if not (_MIN_LAT <= lat <= _MAX_LAT):
+        raise ValueError(f'Latitude {lat} out of range ({_MIN_LAT} to {_MAX_LAT})')
+    if not (_MIN_LON <= lon <= _MAX_LON):
+        raise ValueError(f'Longitude {lon} out of range ({_MIN_LON} to {_MAX_LON})')
+
+    # Normalise to float so the cache key is hashable for any numeric input
+    # (e.g. 0-d NumPy arrays)
+    return _encode_cached(float(lat), float(lon))
+
+def _pin_cells(digi_pin: str) -> bytes:
+    """Validates a DIGIPIN and returns its 10 grid cell indices (0..15)."""
+    # Strip hyphens and map every character to its cell index in one C-level
+    # pass; non-ASCII characters become '?' and so map to _INVALID
+    cells = digi_pin.encode('ascii', 'replace').translate(LUT, b'-')
+    if len(cells) != 10:
+        raise ValueError(f'Invalid DIGIPIN: Expected 10 alphanumeric characters, got {len(cells)} (after removing hyphens).')
+    if _INVALID in cells:
+        char_index = cells.index(_INVALID)
+        char = digi_pin.replace('-', '')[char_index]
+        raise ValueError(f"Invalid character '{char}' in DIGIPIN at position {char_index + 1}.")
+    return cells
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_lat_lng_from_digi_pin(digi_pin: str) -> LatLng:
+    """
+    Decodes a DIGIPIN back into its central latitude and longitude.
+
+    Args:
+        digi_pin (str): The 10-digit DIGIPIN code (can include hyphens).
+
+    Returns:
+        LatLng: A (latitude, longitude) named tuple of floats.
+
+    Raises:
+        ValueError: If the DIGIPIN is invalid (wrong length or invalid characters).
+
+    >>> coords = get_lat_lng_from_digi_pin('39J-49L-L8T4')
+    >>> round(coords.latitude, 6), round(coords.longitude, 6)
+    (28.622793, 77.213049)
+    >>> get_lat_lng_from_digi_pin('39J49LL8T4') == coords
+    True
+    >>> [round(v, 5) for v in get_lat_lng_from_digi_pin('LLL-LLL-LLLL')]
+    [2.50002, 63.50002]
+    >>> [round(v, 5) for v in get_lat_lng_from_digi_pin('888-888-8888')]
+    [38.49998, 99.49998]
+    >>> get_lat_lng_from_digi_pin('39J-49L-L8TA')
+    Traceback (most recent call last):
+        ...
+    ValueError: Invalid character 'A' in DIGIPIN at position 10.
+    """
+    cells = _pin_cells(digi_pin)
+
+    min_lat = _MIN_LAT
+    max_lat = _MAX_LAT
+    min_lon = _MIN_LON
+    max_lon = _MAX_LON
+
+    for char_index, idx in enumerate(cells):
+        r_idx, c_idx = idx >> 2, idx & 3
+
+        lat_div = lon_div = _DIVS[char_index]
+
+        # Narrow the bounding box to the current character's cell. Both ends
+        # are computed from the previous bounds, mirroring the JS logic for
+        # latitude (row 0 is the highest latitude block).
+        min_lat, max_lat = max_lat - lat_div * (r_idx + 1), max_lat - lat_div * r_idx
+        min_lon, max_lon = min_lon + lon_div * c_idx, min_lon + lon_div * (c_idx + 1)
+
+    center_lat = (min_lat + max_lat) / 2
+    center_lon = (min_lon + max_lon) / 2
+
+    return LatLng(center_lat, center_lon)
+
+def _import_numpy():
+    """Imports NumPy on demand; it is only needed for the batch functions."""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError('NumPy is required for batch encoding/decoding (pip install numpy).') from None
+    return np
+
+def get_digipin_batch(lats, lons):
+    """
+    Encodes arrays of latitudes and longitudes into DIGIPINs in one pass.
+
+    Args:
+        lats (array_like): Latitude coordinates.
+        lons (array_like): Longitude coordinates, same length as lats.
+
+    Returns:
+        numpy.ndarray: 1-D array of hyphenated DIGIPIN codes as ASCII
+                       bytes (dtype 'S12').
+
+    Raises:
+        ValueError: If any latitude or longitude is out of the defined bounds.
+
+    >>> get_digipin_batch([28.622788, 2.5, 38.5], [77.213033, 63.5, 99.5]).tolist()
+    [b'39J-49L-L8T4', b'LLL-LLL-LLLL', b'888-888-8888']
+    >>> get_digipin_batch([28.6, 40.0], [77.2, 77.2])
+    Traceback (most recent call last):
+        ...
+    ValueError: Latitude 40.0 out of range (2.5 to 38.5)
+    """
+    np = _import_numpy()
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    lons = np.asarray(lons, dtype=np.float64).ravel()
+    if lats.shape != lons.shape:
+        raise ValueError(f'Expected as many longitudes as latitudes, got {lons.size} and {lats.size}.')
+
+    bad = ~((lats >= _MIN_LAT) & (lats <= _MAX_LAT))
+    if bad.any():
+        raise ValueError(f'Latitude {lats[bad.argmax()]} out of range ({_MIN_LAT} to {_MAX_LAT})')
+    bad = ~((lons >= _MIN_LON) & (lons <= _MAX_LON))
+    if bad.any():
+        raise ValueError(f'Longitude {lons[bad.argmax()]} out of range ({_MIN_LON} to {_MAX_LON})')
+
+    if _digipin_c is not None:
+        out = np.empty((lats.size, 12), dtype=np.uint8)
+        _digipin_c.encode_batch(lats, lons, out)
+        return out.view('S12').ravel()
+
+    # Same 20-bit quantization as get_digipin, one column per level
+    shifts = np.arange(18, -1, -2)
+    li = np.clip(((lats - _MIN_LAT) * LAT_SCALE).astype(np.int64), 0, _CELLS - 1)
+    lo = np.clip(((lons - _MIN_LON) * LON_SCALE).astype(np.int64), 0, _CELLS - 1)
+    rows = 3 - ((li[:, None] >> shifts) & 3)
+    cols = (lo[:, None] >> shifts) & 3
+
+    out = np.tile(np.frombuffer(_TEMPLATE, dtype=np.uint8), (lats.size, 1))
+    out[:, list(SLOTS)] = np.frombuffer(GRID, dtype=np.uint8)[(rows << 2) | cols]
+    return out.view('S12').ravel()
+
+def _raise_invalid_pin(pins):
+    """Raises the scalar decoder's ValueError for the first invalid DIGIPIN."""
+    for pin in pins:
+        _pin_cells(pin)
+    raise AssertionError('expected an invalid DIGIPIN')
+
+def get_lat_lng_batch(pins):
+    """
+    Decodes an array of DIGIPINs back into their central coordinates.
+
+    Accepts exactly the DIGIPINs get_lat_lng_from_digi_pin accepts and
+    raises the same error for the first invalid one.
+
+    Args:
+        pins (array_like): Sequence or array of DIGIPIN codes as str or
+                           bytes (can include hyphens).
+
+    Returns:
+        tuple: Two 1-D float arrays, (latitudes, longitudes).
+
+    Raises:
+        TypeError: If pins is a single str or bytes rather than a sequence.
+        ValueError: If any DIGIPIN is invalid (wrong length or invalid characters).
+
+    >>> lats, lons = get_lat_lng_batch(['39J-49L-L8T4', b'LLL-LLL-LLLL'])
+    >>> lats.round(6).tolist(), lons.round(6).tolist()
+    ([28.622793, 2.500017], [77.213049, 63.500017])
+    >>> get_lat_lng_batch(['39J-49L-L8T4', '39J49LL8T4\\x00'])
+    Traceback (most recent call last):
+        ...
+    ValueError: Invalid DIGIPIN: Expected 10 alphanumeric characters, got 11 (after removing hyphens).
+    """
+    if isinstance(pins, (str, bytes)):
+        raise TypeError('Expected a sequence of DIGIPINs, got a single one; use get_lat_lng_from_digi_pin.')
+    np = _import_numpy()
+
+    # Work on the original Python strings: NumPy's fixed-width string dtypes
+    # would silently drop trailing NUL characters
+    if isinstance(pins, np.ndarray):
+        if pins.dtype.kind == 'S':
+            try:
+                pins = pins.astype('U')
+            except UnicodeDecodeError:
+                pass
+        pins = pins.ravel().tolist()
+    else:
+        pins = list(pins)
+    if not pins:
+        return np.empty(0), np.empty(0)
+    try:
+        text = ''.join(pins)
+    except TypeError:
+        pins = [pin.decode('ascii', 'replace') if isinstance(pin, bytes) else pin for pin in pins]
+        text = ''.join(pins)
+    if not text.isascii():
+        _raise_invalid_pin(pins)
+
+    # One ASCII buffer for all pins; per-pin lengths locate each pin in it
+    buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    lengths = np.fromiter(map(len, pins), dtype=np.intp, count=len(pins))
+    ends = np.cumsum(lengths)
+    keep = buf != ord('-')
+    kept = np.concatenate(([0], np.cumsum(keep)))
+    if ((kept[ends] - kept[ends - lengths]) != 10).any():
+        _raise_invalid_pin(pins)
+
+    cells = np.frombuffer(LUT, dtype=np.uint8)[buf[keep].reshape(-1, 10)]
+    if (cells == _INVALID).any():
+        _raise_invalid_pin(pins)
+
+    # Reassemble the 20-bit cell indices and take the centre of each cell
+    shifts = np.arange(18, -1, -2)
+    li = ((3 - (cells >> 2)).astype(np.int64) << shifts).sum(axis=1)
+    lo = ((cells & 3).astype(np.int64) << shifts).sum(axis=1)
+    center_lat = _MIN_LAT + (li + 0.5) / LAT_SCALE
+    center_lon = _MIN_LON + (lo + 0.5) / LON_SCALE
+    return center_lat, center_lon
+
+# Numba kernel behind get_digipin_fast: None until first use, False when
+# NumPy/Numba are unavailable and the pure-Python encoder is used instead
+_encode_nb = None
+
+def _load_encode_nb():
+    """Compiles (or loads from cache) the Numba encoder kernel on demand."""
+    global _encode_nb
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        _encode_nb = False
+        return _encode_nb
+
+    grid = np.frombuffer(GRID, dtype=np.uint8)
+    slots = SLOTS
+
+    @njit(cache=True, boundscheck=False)
+    def encode(lat, lon, out):
+        li = int((lat - _MIN_LAT) * LAT_SCALE)
+        lo = int((lon - _MIN_LON) * LON_SCALE)
+        li -= li >> 20
+        lo -= lo >> 20
+        out[3] = out[7] = 45  # '-'
+        for level in range(10):
+            shift = 18 - 2 * level
+            row = 3 - ((li >> shift) & 3)
+            col = (lo >> shift) & 3
+            out[slots[level]] = grid[(row << 2) | col]
+
+    # Output buffers are reused per thread: allocating a fresh array on every
+    # call costs more than the kernel itself
+    _encode_nb = (encode, np, threading.local())
+    return _encode_nb
+
+def get_digipin_fast(lat: float, lon: float) -> str:
+    """
+    Same as get_digipin, but runs the encoder as native code.
+
+    Uses the _digipin_c extension when it has been built, otherwise a
+    Numba kernel compiled on the first call and cached on disk; without
+    either this simply calls get_digipin. It does not cache results, so for
+    heavily repeated inputs a cached get_digipin hit is still faster.
+
+    Args:
+        lat (float): Latitude coordinate.
+        lon (float): Longitude coordinate.
+
+    Returns:
+        str: The 10-digit DIGIPIN code.
+
+    Raises:
+        ValueError: If latitude or longitude is out of the defined bounds.
+
+    >>> get_digipin_fast(28.622788, 77.213033)
+    '39J-49L-L8T4'
+    >>> get_digipin_fast(2.5, 63.5), get_digipin_fast(38.5, 99.5)
+    ('LLL-LLL-LLLL', '888-888-8888')
+    >>> get_digipin_fast(28.6, 100.0)
+    Traceback (most recent call last):
+        ...
+    ValueError: Longitude 100.0 out of range (63.5 to 99.5)
+    """
+    kernel = None
+    if _digipin_c is None:
+        kernel = _encode_nb if _encode_nb is not None else _load_encode_nb()
+        if not kernel:
+            return get_digipin(lat, lon)
+
+    if not (_MIN_LAT <= lat <= _MAX_LAT):
+        raise ValueError(f'Latitude {lat} out of range ({_MIN_LAT} to {_MAX_LAT})')
+    if not (_MIN_LON <= lon <= _MAX_LON):
+        raise ValueError(f'Longitude {lon} out of range ({_MIN_LON} to {_MAX_LON})')
+
+    if kernel is None:
+        return _digipin_c.encode(lat, lon).decode('ascii')
+
+    encode, np, buffers = kernel
+    out = getattr(buffers, 'out', None)
+    if out is None:
+        out = buffers.out = np.empty(12, dtype=np.uint8)
+    encode(float(lat), float(lon), out)
+    return out.tobytes().decode('ascii')
+
+class _TreeNode:
+    """A DigipinTree node: one child per grid character plus its records."""
+    __slots__ = ('children', 'cache')
+
+    def __init__(self):
+        self.children = [None] * 16
+        self.cache = []
+
+class DigipinTree:
+    """
+    A 16-ary prefix tree over DIGIPIN characters for proximity lookups.
+
+    Each DIGIPIN prefix is a grid cell, so every node caches the payloads
+    of all records beneath it and the records near a DIGIPIN are the ones
+    sharing its first few characters; no distance computations are needed.
+
+    >>> tree = DigipinTree()
+    >>> tree.insert('39J-49L-L8T4', 'Dak Bhawan')
+    >>> tree.insert('39J-49L-MFKM', 'nearby')
+    >>> tree.insert('4P3-JK8-52C9', 'Bengaluru')
+    >>> tree.neighbors('39J-49L-L8T4', 0)
+    ['Dak Bhawan', 'nearby', 'Bengaluru']
+    >>> tree.neighbors('39J-49L-L8T4', 6)
+    ['Dak Bhawan', 'nearby']
+    >>> tree.neighbors('39J49LL8T4', 10)
+    ['Dak Bhawan']
+    >>> tree.insert('bad', 'x')
+    Traceback (most recent call last):
+        ...
+    ValueError: Invalid DIGIPIN: Expected 10 alphanumeric characters, got 3 (after removing hyphens).
+    >>> len(tree)
+    3
+    >>> tree.neighbors('39J-49L-L8T4', 11)
+    Traceback (most recent call last):
+        ...
+    ValueError: prefix_len must be between 0 and 10, got 11.
+    """
+
+    def __init__(self):
+        self._root = _TreeNode()
+
+    def __len__(self):
+        return len(self._root.cache)
+
+    def insert(self, digi_pin: str, payload) -> None:
+        """
+        Adds a record under a DIGIPIN.
+
+        Args:
+            digi_pin (str): The 10-digit DIGIPIN code (can include hyphens).
+            payload: Any object to return from neighbors().
+
+        Raises:
+            ValueError: If the DIGIPIN is invalid.
+        """
+        # Validate before touching the tree so a rejected DIGIPIN adds nothing
+        cells = _pin_cells(digi_pin)
+        node = self._root
+        node.cache.append(payload)
+        for idx in cells:
+            child = node.children[idx]
+            if child is None:
+                child = node.children[idx] = _TreeNode()
+            node = child
+            node.cache.append(payload)
+
+    def neighbors(self, digi_pin: str, prefix_len: int = 6) -> list:
+        """
+        Returns the payloads of all records sharing a DIGIPIN's prefix.
+
+        Args:
+            digi_pin (str): The 10-digit DIGIPIN code (can include hyphens).
+            prefix_len (int): Number of leading characters (levels) that must
+                              match, from 0 (everything) to 10 (same cell).
+
+        Returns:
+            list: The matching payloads, in insertion order.
+
+        Raises:
+            ValueError: If the DIGIPIN or prefix_len is invalid.
+        """
+        if not 0 <= prefix_len <= 10:
+            raise ValueError(f'prefix_len must be between 0 and 10, got {prefix_len}.')
+        node = self._root
+        for idx in _pin_cells(digi_pin)[:prefix_len]:
+            node = node.children[idx]
+            if node is None:
+                return []
+        return list(node.cache)
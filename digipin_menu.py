@@ -0,0 +1,60 @@
+import sys # Import sys for exiting the program
+
+from digipin_core import get_digipin, get_lat_lng_from_digi_pin
+
+# Interactive, menu-driven DIGIPIN tool
+
+def display_menu():
+    """Displays the main menu options to the user."""
+    print("\n--- India DIGIPIN Tool ---")
+    print("1. Encode Latitude and Longitude to DIGIPIN")
+    print("2. Decode DIGIPIN to Latitude and Longitude")
+    print("3. Exit")
+    print("----------------------------")
+
+def run_encoder():
+    """Handles the encoding process, taking user input for latitude and longitude."""
+    try:
+        latitude_str = input("Enter Latitude (e.g., 28.622788): ")
+        longitude_str = input("Enter Longitude (e.g., 77.213033): ")
+
+        latitude = float(latitude_str)
+        longitude = float(longitude_str)
+
+        digipin_code = get_digipin(latitude, longitude)
+        print(f"\nResulting DIGIPIN: {digipin_code}")
+    except ValueError as e:
+        print(f"Error: Invalid input. {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred during encoding: {e}")
+
+def run_decoder():
+    """Handles the decoding process, taking user input for a DIGIPIN."""
+    try:
+        digipin_input = input("Enter DIGIPIN (e.g., '39J-49L-L8T4' or '39J49LL8T4'): ")
+        coords = get_lat_lng_from_digi_pin(digipin_input)
+        print(f"\nDecoded Latitude: {coords.latitude:.6f}")
+        print(f"Decoded Longitude: {coords.longitude:.6f}")
+    except ValueError as e:
+        print(f"Error: Invalid input. {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred during decoding: {e}")
+
+def run_menu():
+    """Runs the interactive DIGIPIN tool until the user exits."""
+    while True:
+        display_menu()
+        choice = input("Enter your choice (1, 2, or 3): ").strip()
+
+        if choice == '1':
+            run_encoder()
+        elif choice == '2':
+            run_decoder()
+        elif choice == '3':
+            print("Exiting India DIGIPIN Tool. Goodbye!")
+            sys.exit(0) # Exit the program
+        else:
+            print("Invalid choice. Please enter 1, 2, or 3.")
+
+if __name__ == "__main__":
+    run_menu()